@@ -1,5 +1,7 @@
+import functools
 import os
 import subprocess
+import tempfile
 from pathlib import Path
 import shutil
 
@@ -21,22 +23,17 @@ def is_path_contains_7z_executable(sevenz_path: str) -> bool:
 def is_executable_a_7z(sevenz_path: str) -> bool:
     """
     Checks if the 7z executable is installed.
+    The result is cached per executable and its modification time, so the executable is run only once, unless it
+    is replaced.
     :param sevenz_path: string, The path to the 7z executable.
     :return: bool, True if the 7z executable is installed, False otherwise.
     """
 
     # Check if the process itself is installed.
-    if shutil.which(sevenz_path):
-        # Check that this is the 7z executable.
+    executable_path = shutil.which(sevenz_path)
+    if executable_path:
         try:
-            # Run '7z' command and capture output
-            result = subprocess.run([sevenz_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-            # Check if the output contains identifying information
-            if b"7-Zip" in result.stdout or b"7-Zip" in result.stderr:
-                return True
-            else:
-                return False
+            return _is_executable_a_7z_cached(executable_path, os.stat(executable_path).st_mtime_ns)
         except Exception as e:
             _ = e
             return False
@@ -44,6 +41,23 @@ def is_executable_a_7z(sevenz_path: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=32)
+def _is_executable_a_7z_cached(executable_path: str, modified_time_ns: int) -> bool:
+    # 'modified_time_ns' is only part of the cache key.
+    _ = modified_time_ns
+
+    # Check that this is the 7z executable.
+    # Run '7z' command and capture output. Exceptions aren't cached, so a timeout is checked again on the next call.
+    result = subprocess.run(
+        [executable_path], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=2)
+
+    # Check if the output contains identifying information
+    if b"7-Zip" in result.stdout or b"7-Zip" in result.stderr:
+        return True
+    else:
+        return False
+
+
 def extract_file(
         file_path: str,
         extract_to: str,
@@ -52,6 +66,8 @@ def extract_file(
 ):
     """
     Extracts a file to a directory using 7z executable.
+    Each call runs a separate 7z process. If you call it in a loop over many archives, use 'extract_files_batch'
+    instead.
     :param file_path: string, The path to the file to extract.
     :param extract_to: string, The directory to extract the file to.
     :param sevenz_path: string, The path to the 7z executable.
@@ -60,16 +76,7 @@ def extract_file(
     :return:
     """
 
-    # Check if the path contains 7z executable.
-    if not is_path_contains_7z_executable(sevenz_path):
-        raise ValueError("The path to 7z does not contain 7z executable")
-
-    if not sevenz_path:
-        sevenz_path = '7z'
-
-    # Check if the 7z executable is installed.
-    if not is_executable_a_7z(sevenz_path):
-        raise RuntimeError("'7z executable' is not a 7z")
+    sevenz_path = _get_checked_sevenz_path(sevenz_path)
 
     if not os.path.exists(extract_to):
         os.makedirs(extract_to)
@@ -80,3 +87,78 @@ def extract_file(
 
     subprocess.run(command, check=True)
     print(f"Extracted {file_path} to {extract_to}")
+
+
+def extract_files_batch(
+        file_paths: list[str],
+        extract_to: str,
+        sevenz_path: str = None,
+        force_overwrite: bool = False,
+        member_patterns: list[str] = None
+):
+    """
+    Extracts several archives to a directory with a single 7z process.
+    The archive paths are passed to 7z in a list file, so there is one process start for all of them. With
+    'member_patterns', 7z also extracts all the matching files of a solid archive in one pass over its solid blocks,
+    instead of decoding the blocks again for each file.
+    :param file_paths: list of strings, The paths to the files to extract.
+    :param extract_to: string, The directory to extract the files to.
+    :param sevenz_path: string, The path to the 7z executable.
+        If None, the default path is used, assuming you added 7z to the PATH environment variable.
+    :param force_overwrite: bool, If True, the files will be overwritten if they already exist in the output folder.
+    :param member_patterns: list of strings, default is None. 7z wildcards of the files inside the archives to
+        extract, like 'docs/*.txt'. If None, all the files are extracted.
+    :return:
+    """
+
+    sevenz_path = _get_checked_sevenz_path(sevenz_path)
+
+    if not os.path.exists(extract_to):
+        os.makedirs(extract_to)
+
+    list_files: list[str] = []
+    try:
+        archives_list_file = _write_list_file(file_paths)
+        list_files.append(archives_list_file)
+
+        # '-an' disables the archive name argument, the archives are taken from the list file with '-ai'.
+        command = [f'{sevenz_path}', 'x', '-an', '-scsUTF-8', f'-ai@{archives_list_file}', f'-o{extract_to}']
+        if member_patterns:
+            patterns_list_file = _write_list_file(member_patterns)
+            list_files.append(patterns_list_file)
+            command.append(f'-i@{patterns_list_file}')
+        if force_overwrite:
+            command.append('-y')
+
+        subprocess.run(command, check=True)
+    finally:
+        for list_file in list_files:
+            os.remove(list_file)
+
+    print(f"Extracted {len(file_paths)} files to {extract_to}")
+
+
+def _write_list_file(lines: list[str]) -> str:
+    """
+    Write the lines to a temporary list file for 7z and return its path.
+    The file is closed before 7z reads it, since on Windows it can't be opened while it is open here.
+    """
+
+    with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', suffix='.txt', delete=False) as list_file:
+        list_file.write('\n'.join(lines) + '\n')
+    return list_file.name
+
+
+def _get_checked_sevenz_path(sevenz_path: str = None) -> str:
+    if not sevenz_path:
+        sevenz_path = '7z'
+
+    # Check if the path contains 7z executable.
+    if not is_path_contains_7z_executable(sevenz_path):
+        raise ValueError("The path to 7z does not contain 7z executable")
+
+    # Check if the 7z executable is installed.
+    if not is_executable_a_7z(sevenz_path):
+        raise RuntimeError("'7z executable' is not a 7z")
+
+    return sevenz_path
@@ -4,6 +4,11 @@ from typing import Union
 import py7zr
 
 
+# 7z file signature (magic number)
+# The signature is '7z' followed by 'BCAF271C'
+SEVENZ_MAGIC_NUMBER: bytes = b'7z\xBC\xAF\x27\x1C'
+
+
 def is_7z_magic_number(
         file_object: Union[str, bytes]
 ) -> bool:
@@ -28,12 +33,8 @@ def is_7z_magic_number(
     if len(data) < 6:
         return False
 
-    # 7z file signature (magic number)
-    # The signature is '7z' followed by 'BCAF271C'
-    seven_z_signature = b'7z\xBC\xAF\x27\x1C'
-
     # Compare the first 6 bytes of the data with the 7z signature
-    result = data.startswith(seven_z_signature)
+    result = data.startswith(SEVENZ_MAGIC_NUMBER)
 
     return result
 
@@ -1,36 +1,105 @@
 import os
+import struct
 import time
 import zipfile
+import zlib
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Union, Literal
 from pathlib import Path
 import shutil
 
 
-def is_zip_zipfile(file_object: Union[str, bytes]) -> bool:
+# Signatures at the start of zip files, see 'is_zip_magic_number'.
+ZIP_MAGIC_NUMBERS: frozenset = frozenset({b'PK\x03\x04', b'PK\x05\x06', b'PK\x07\x08'})
+# The end of central directory record is 22 bytes long and can be followed by a comment of up to 64 KiB.
+END_RECORD_SIZE: int = 22
+END_RECORD_MAX_DISTANCE: int = END_RECORD_SIZE + (1 << 16)
+
+
+def is_zip_zipfile(file_object: Union[str, bytes], verify: bool = False) -> bool:
     """
     Function checks if the file is a zip file.
+    By default, only the end of central directory record is located and validated against the start of the central
+    directory, the archived files aren't decompressed.
     :param file_object: can be two types:
         string, full path to the file.
         bytes or BytesIO, the bytes of the file.
+    :param verify: boolean, default is 'False'.
+        'True': CRCs of all the archived files are checked with 'testzip()', the file is considered a zip file only if
+            all of them are correct. This decompresses the whole archive.
+        'False': Only the structure of the end of the archive is checked.
     :return: boolean.
     """
 
-    try:
-        if isinstance(file_object, bytes):
-            with BytesIO(file_object) as file_object:
-                with zipfile.ZipFile(file_object) as zip_object:
-                    zip_object.testzip()
-                    return True
-        elif isinstance(file_object, str):
-            with zipfile.ZipFile(file_object) as zip_object:
-                zip_object.testzip()
+    if not isinstance(file_object, (str, bytes)):
+        raise TypeError("file_object must be of type 'str' or 'bytes'.")
+
+    if verify:
+        try:
+            with zipfile.ZipFile(BytesIO(file_object) if isinstance(file_object, bytes) else file_object) as zip_object:
+                return zip_object.testzip() is None
+        except zipfile.BadZipFile:
+            return False
+
+    if isinstance(file_object, bytes):
+        is_valid = _is_end_record_valid(
+            file_object, 0, max(0, len(file_object) - END_RECORD_MAX_DISTANCE),
+            lambda offset, size: file_object[offset:offset + size])
+    else:
+        with open(file_object, 'rb') as file:
+            tail_offset = max(0, file.seek(0, os.SEEK_END) - END_RECORD_MAX_DISTANCE)
+            file.seek(tail_offset)
+            tail = file.read()
+
+            def read_at(offset: int, size: int) -> bytes:
+                file.seek(offset)
+                return file.read(size)
+
+            is_valid = _is_end_record_valid(tail, tail_offset, 0, read_at)
+
+    if is_valid is None:
+        # Zip64 archive, let 'zipfile' parse the central directory.
+        try:
+            with zipfile.ZipFile(BytesIO(file_object) if isinstance(file_object, bytes) else file_object):
                 return True
-        else:
-            raise TypeError("file_object must be of type 'str' or 'bytes'.")
-    except zipfile.BadZipFile:
+        except zipfile.BadZipFile:
+            return False
+    return is_valid
+
+
+def _is_end_record_valid(data: bytes, data_offset: int, search_start: int, read_at) -> Union[bool, None]:
+    """
+    Find the end of central directory record in 'data' and check that it points to the central directory.
+    :param data: bytes, the end of the file.
+    :param data_offset: integer, offset of 'data' in the file.
+    :param search_start: integer, position in 'data' to search the record from.
+    :param read_at: callable, (offset, size) -> bytes from the file.
+    :return: boolean, or None if this is a zip64 archive that can't be validated by the record alone.
+    """
+
+    position = data.rfind(b'PK\x05\x06', search_start)
+    if position == -1 or len(data) - position < END_RECORD_SIZE:
         return False
 
+    (_, _, _, _, entries_total, central_directory_size, central_directory_offset, _) = (
+        struct.unpack('<4s4H2LH', data[position:position + END_RECORD_SIZE]))
+
+    # Zip64 archives keep the real values in the zip64 end of central directory record before this one.
+    if (entries_total == 0xFFFF or 0xFFFFFFFF in (central_directory_size, central_directory_offset) or
+            position < 20 or data[position - 20:position - 16] == b'PK\x06\x07'):
+        return None
+
+    # If there is data before the archive (SFX), the offsets in the record are relative to the start of the archive.
+    central_directory_start = data_offset + position - central_directory_size
+    if central_directory_start < central_directory_offset:
+        return False
+    if entries_total == 0:
+        return central_directory_size == 0
+    return read_at(central_directory_start, 4) == b'PK\x01\x02'
+
 
 def is_zip_magic_number(file_path: str) -> bool:
     """
@@ -48,19 +117,121 @@ def is_zip_magic_number(file_path: str) -> bool:
         It's found in the end of central directory locator for ZIP files that are split across multiple volumes.
     """
 
-    with open(file_path, 'rb') as file:
-        # Read the first 4 bytes of the file
-        signature = file.read(4)
+    # Read the first 4 bytes of the file. 'os.pread' reads from the offset without a separate seek, it isn't
+    # available on Windows.
+    if hasattr(os, 'pread'):
+        file_descriptor = os.open(file_path, os.O_RDONLY)
+        try:
+            signature = os.pread(file_descriptor, 4, 0)
+        finally:
+            os.close(file_descriptor)
+    else:
+        with open(file_path, 'rb') as file:
+            signature = file.read(4)
 
     # Check if the signature matches any of the ZIP signatures
-    return signature in [b'PK\x03\x04', b'PK\x05\x06', b'PK\x07\x08']
+    return signature in ZIP_MAGIC_NUMBERS
+
+
+def read_members_with_pread(file_path: str, zip_infos: list, max_workers: int = None) -> list[bytes]:
+    """
+    Function reads and decompresses the members of the zip file using positional reads on a single file descriptor.
+    See 'iter_members_with_pread'.
+
+    :param file_path: string, full path to the zip file.
+    :param zip_infos: list of 'zipfile.ZipInfo' objects of the members to read, from 'zipfile.ZipFile.infolist()'.
+    :param max_workers: integer, default is None. Number of the inflating threads, by default the number of CPUs.
+    :return: list of bytes, the content of each member in the same order as 'zip_infos'.
+    """
+
+    return list(iter_members_with_pread(file_path, zip_infos, max_workers))
+
+
+def iter_members_with_pread(file_path: str, zip_infos: list, max_workers: int = None):
+    """
+    Generator reads and decompresses the members of the zip file using positional reads on a single file descriptor.
+    The compressed payloads are inflated in a thread pool while the next ones are still being read, 'zlib' releases
+    the GIL while inflating. Only 'max_workers * 2' members are in flight at a time to keep the memory bounded.
+    Members that are encrypted or use compression other than 'store' and 'deflate', and platforms without 'os.pread',
+    fall back to 'zipfile.ZipFile.read'.
+
+    :param file_path: string, full path to the zip file.
+    :param zip_infos: list of 'zipfile.ZipInfo' objects of the members to read, from 'zipfile.ZipFile.infolist()'.
+    :param max_workers: integer, default is None. Number of the inflating threads, by default the number of CPUs.
+    :return: yields bytes, the content of each member in the same order as 'zip_infos'.
+    """
+
+    if not hasattr(os, 'pread'):
+        with zipfile.ZipFile(file_path) as zip_object:
+            for zip_info in zip_infos:
+                yield zip_object.read(zip_info)
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    zip_object = None
+    file_descriptor = os.open(file_path, os.O_RDONLY)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: deque = deque()
+            try:
+                for zip_info in zip_infos:
+                    if (zip_info.flag_bits & 0x1 or
+                            zip_info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)):
+                        if zip_object is None:
+                            zip_object = zipfile.ZipFile(file_path)
+                        pending.append(executor.submit(zip_object.read, zip_info))
+                    else:
+                        # Local file header: signature, fixed fields, then file name and extra field of variable length.
+                        header = os.pread(file_descriptor, 30, zip_info.header_offset)
+                        if len(header) != 30 or header[:4] != b'PK\x03\x04':
+                            raise zipfile.BadZipFile(f"Bad magic number for file header: {zip_info.filename!r}")
+                        name_length, extra_length = struct.unpack('<HH', header[26:30])
+                        data_offset = zip_info.header_offset + 30 + name_length + extra_length
+
+                        payload = os.pread(file_descriptor, zip_info.compress_size, data_offset)
+                        pending.append(executor.submit(_inflate_member, zip_info, payload))
+
+                    while len(pending) > max_workers * 2:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # The generator was closed or failed, don't inflate the rest.
+                for future in pending:
+                    future.cancel()
+    finally:
+        os.close(file_descriptor)
+        if zip_object is not None:
+            zip_object.close()
+
+
+def _inflate_member(zip_info: zipfile.ZipInfo, payload: bytes) -> bytes:
+    if len(payload) != zip_info.compress_size:
+        raise zipfile.BadZipFile(f"Truncated file data: {zip_info.filename!r}")
+
+    if zip_info.compress_type == zipfile.ZIP_DEFLATED:
+        data = zlib.decompressobj(-zlib.MAX_WBITS).decompress(payload)
+    else:
+        data = payload
+
+    if zlib.crc32(data) != zip_info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {zip_info.filename!r}")
+    return data
+
+
+# Buffer size for copying the archived files to the disk.
+COPY_BUFFER_SIZE: int = 1 << 20
+WINDOWS_ILLEGAL_NAME_CHARACTERS = str.maketrans(':<>|"?*', '_' * 7)
 
 
 def extract_archive_with_zipfile(
         archive_path: str,
         extract_directory: str = None,
         files_without_directories: bool = False,
-        remove_first_directory: bool = False
+        remove_first_directory: bool = False,
+        verbose: bool = False
 ) -> str:
     """
     Function will extract the archive using standard library 'zipfile'.
@@ -79,6 +250,7 @@ def extract_archive_with_zipfile(
         'True': all the files will be extracted without first directory in the hierarchy.
             Example: package_some_name_1.1.1_build/subdir1/file.exe
             Will be extracted as: subdir/file.exe
+    :param verbose: boolean, default is 'False'. If 'True', print the name of each extracted file.
 
     :return: string, full path to directory that the files were extracted to.
     """
@@ -89,6 +261,10 @@ def extract_archive_with_zipfile(
 
     print(f'Extracting to directory: {extract_directory}')
 
+    # Paths and archived datetime of the extracted files, applied after all the files are written.
+    extracted_files_times: list[tuple[str, int]] = []
+    created_directories: set[str] = set()
+
     # initiating the archived file path as 'zipfile.ZipFile' object.
     with zipfile.ZipFile(archive_path) as zip_object:
         # '.infolist()' method of the object contains all the directories and files that are in the archive including
@@ -102,29 +278,73 @@ def extract_archive_with_zipfile(
 
             if files_without_directories:
                 # Put into 'filename' the string that contains only the filename without subdirectories.
-                zip_info.filename = os.path.basename(zip_info.filename)
+                file_name = os.path.basename(zip_info.filename)
             elif remove_first_directory:
                 # Cut the first directory from the filename.
-                zip_info.filename = zip_info.filename.split('/', maxsplit=1)[1]
+                file_name = zip_info.filename.split('/', maxsplit=1)[1]
+            else:
+                file_name = zip_info.filename
 
-            print(f'Extracting: {zip_info.filename}')
+            if verbose:
+                print(f'Extracting: {file_name}')
 
-            # Extract current file from the archive using 'zip_info' of the current file with 'filename' that we
-            # updated under specified parameters to specified directory.
-            zip_object.extract(zip_info, extract_directory)
+            # Get full path to extracted file, the same way 'zip_object.extract' does.
+            extracted_file_path: str = _get_extract_path(extract_directory, file_name)
+            parent_directory: str = os.path.dirname(extracted_file_path)
+            if parent_directory not in created_directories:
+                os.makedirs(parent_directory, exist_ok=True)
+                created_directories.add(parent_directory)
 
-            # === Change the date and time of extracted file from current time to the time specified in 'zip_info'.
-            # Get full path to extracted file.
-            extracted_file_path: str = extract_directory + os.sep + zip_info.filename
-            # Create needed datetime object with original archived datetime from 'zip_info.date_time'.
-            date_time = time.mktime(zip_info.date_time + (0, 0, -1))
-            # Using 'os' library, changed the datetime of the file to the object created in previous step.
-            os.utime(extracted_file_path, (date_time, date_time))
+            # Copy the decompressed file with a large buffer. The buffered file passes chunks larger than its buffer
+            # straight to the disk and retries short writes.
+            with zip_object.open(zip_info) as source, open(extracted_file_path, 'wb') as target:
+                shutil.copyfileobj(source, target, length=COPY_BUFFER_SIZE)
+
+            # Original archived datetime from 'zip_info.date_time'.
+            extracted_files_times.append((extracted_file_path, _get_date_time_ns(zip_info.date_time)))
+
+    # === Change the date and time of extracted files from current time to the time specified in 'zip_info'.
+    for extracted_file_path, date_time_ns in extracted_files_times:
+        os.utime(extracted_file_path, ns=(date_time_ns, date_time_ns))
     print('Extraction done.')
 
     return extract_directory
 
 
+def _get_date_time_ns(date_time: tuple) -> int:
+    """
+    Convert the local 'zip_info.date_time' to a timestamp in nanoseconds for 'os.utime'.
+    Zip times have 2-second resolution, so whole seconds are converted to nanoseconds without float rounding.
+    """
+
+    try:
+        timestamp = datetime(*date_time).timestamp()
+    except ValueError:
+        # DOS times that 'datetime' rejects, like the all-zero date that zipfile parses as (1980, 0, 0, 0, 0, 0) or
+        # seconds of 60-62, are normalised by 'time.mktime'.
+        timestamp = time.mktime(date_time + (0, 0, -1))
+    return int(timestamp) * 1_000_000_000
+
+
+def _get_extract_path(extract_directory: str, file_name: str) -> str:
+    """
+    Build the path of the archived file inside 'extract_directory'.
+    Absolute paths, drive letters, '.' and '..' parts are removed, so the file can't be written outside of the
+    directory. On Windows, illegal characters are replaced with '_'.
+    """
+
+    arcname = file_name.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+    if os.path.sep == '\\':
+        parts = [part.translate(WINDOWS_ILLEGAL_NAME_CHARACTERS).rstrip('.') for part in parts]
+        parts = [part for part in parts if part]
+
+    return os.path.normpath(os.path.join(extract_directory, *parts))
+
+
 def get_file_list_from_zip(file_path: str) -> list:
     """
     Function returns the list of file names and their relative directories inside the zip file.
@@ -136,6 +356,41 @@ def get_file_list_from_zip(file_path: str) -> list:
         return zip_object.namelist()
 
 
+# Files bigger than this are compressed by the main thread while streaming them from the disk, instead of being read
+# to memory by a worker in the parallel archiving.
+PARALLEL_MAX_FILE_SIZE: int = 64 * 1024 * 1024
+
+
+def _walk_fast(directory_path: str):
+    """
+    Generator yields the files of the directory recursively as 'os.DirEntry' objects.
+    Same order as 'os.walk' top-down: the files of a directory first, then its subdirectories.
+    Symlinks to directories are not followed, and unreadable directories are skipped.
+    :param directory_path: string, full path to the directory.
+    """
+
+    try:
+        scanned_entries = os.scandir(directory_path)
+    except OSError:
+        return
+
+    sub_directories: list[str] = []
+    with scanned_entries:
+        for entry in scanned_entries:
+            try:
+                is_directory: bool = entry.is_dir()
+            except OSError:
+                is_directory = False
+
+            if not is_directory:
+                yield entry
+            elif not entry.is_symlink():
+                sub_directories.append(entry.path)
+
+    for sub_directory in sub_directories:
+        yield from _walk_fast(sub_directory)
+
+
 def archive_directory(
         directory_path: str,
         compression: Literal[
@@ -144,7 +399,8 @@ def archive_directory(
             'bzip2',
             'lzma'] = 'deflate',
         include_root_directory: bool = True,
-        remove_original: bool = False
+        remove_original: bool = False,
+        max_workers: int = None
 ) -> str:
     """
     Function archives the directory.
@@ -163,6 +419,9 @@ def archive_directory(
         'False': The root directory will not be included in the archive.
         True is usually the case in most archiving utilities.
     :param remove_original: boolean, default is 'False'. If 'True', the original directory will be removed.
+    :param max_workers: integer, default is None. If bigger than 1, the files are compressed in parallel by worker
+        threads and written to the archive in the same order by the main thread. Files bigger than
+        PARALLEL_MAX_FILE_SIZE are still compressed by the main thread.
     :return: string, full path to the archived file.
     """
 
@@ -177,21 +436,99 @@ def archive_directory(
     else:
         raise ValueError(f"Unsupported compression method: {compression}")
 
-    archive_path: str = directory_path + '.zip'
-    with zipfile.ZipFile(archive_path, 'w', compression_method) as zip_object:
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                file_path = os.path.join(root, file)
+    # Collect the files and their names inside the archive first.
+    # The names inside the archive are sliced from the scanned paths instead of computing a relative path per file.
+    walk_root: str = os.path.normpath(directory_path)
+    # If including the root directory, use the relative path from the parent directory of the root.
+    if include_root_directory:
+        arcname_start: int = len(os.path.join(os.path.dirname(walk_root), ''))
+    else:
+        arcname_start: int = len(os.path.join(walk_root, ''))
 
-                # If including the root directory, use the relative path from the parent directory of the root
-                if include_root_directory:
-                    arcname = os.path.relpath(file_path, os.path.dirname(directory_path))
-                else:
-                    arcname = os.path.relpath(file_path, directory_path)
+    archived_files: list[tuple[str, str]] = [
+        (entry.path, entry.path[arcname_start:]) for entry in _walk_fast(walk_root)]
 
+    archive_path: str = directory_path + '.zip'
+    with zipfile.ZipFile(archive_path, 'w', compression_method) as zip_object:
+        if max_workers and max_workers > 1 and compression_method != zipfile.ZIP_STORED:
+            _write_files_in_parallel(zip_object, archived_files, compression_method, max_workers)
+        else:
+            for file_path, arcname in archived_files:
                 zip_object.write(file_path, arcname)
 
     if remove_original:
         shutil.rmtree(directory_path, ignore_errors=True)
 
     return archive_path
+
+
+def _write_files_in_parallel(
+        zip_object: zipfile.ZipFile, archived_files: list[tuple[str, str]], compress_type: int, max_workers: int):
+    """
+    Compress the files in a thread pool and write the results to the archive in the order of 'archived_files'.
+    'zlib', 'bz2' and 'lzma' release the GIL while compressing, so the threads compress in parallel.
+    Only 'max_workers * 2' files are in flight at a time to keep the memory bounded.
+    """
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+        for file_path, arcname in archived_files:
+            if os.path.getsize(file_path) > PARALLEL_MAX_FILE_SIZE:
+                pending.append((file_path, arcname))
+            else:
+                pending.append(executor.submit(_compress_file, file_path, arcname, compress_type))
+
+            while len(pending) > max_workers * 2:
+                _write_pending(zip_object, pending.popleft())
+        while pending:
+            _write_pending(zip_object, pending.popleft())
+
+
+def _write_pending(zip_object: zipfile.ZipFile, pending):
+    if isinstance(pending, tuple):
+        file_path, arcname = pending
+        zip_object.write(file_path, arcname)
+    else:
+        _write_compressed_file(zip_object, *pending.result())
+
+
+def _compress_file(file_path: str, arcname: str, compress_type: int) -> tuple[zipfile.ZipInfo, bytes]:
+    zip_info = zipfile.ZipInfo.from_file(file_path, arcname)
+    with open(file_path, 'rb') as file:
+        data = file.read()
+
+    zip_info.compress_type = compress_type
+    zip_info.file_size = len(data)
+    zip_info.CRC = zlib.crc32(data)
+    # LZMA compressed data includes an end-of-stream marker, flagged the same way 'zipfile' does.
+    zip_info.flag_bits = 0x02 if compress_type == zipfile.ZIP_LZMA else 0x00
+
+    # The same compressor 'zipfile' uses, so LZMA gets its properties header.
+    compressor = zipfile._get_compressor(compress_type)
+    payload = compressor.compress(data) + compressor.flush()
+    zip_info.compress_size = len(payload)
+    return zip_info, payload
+
+
+def _write_compressed_file(zip_object: zipfile.ZipFile, zip_info: zipfile.ZipInfo, payload: bytes):
+    """
+    Write a file that is already compressed to the archive.
+    'zipfile' has no public API for this, so these are the steps of 'ZipFile.open(mode='w')' with the sizes and the
+    CRC already known, so the local header doesn't need to be rewritten after the data.
+    """
+
+    zip64 = zip_info.file_size > zipfile.ZIP64_LIMIT or zip_info.compress_size > zipfile.ZIP64_LIMIT
+    if zip64 and not zip_object._allowZip64:
+        raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+
+    zip_object.fp.seek(zip_object.start_dir)
+    zip_info.header_offset = zip_object.fp.tell()
+    zip_object._writecheck(zip_info)
+    zip_object._didModify = True
+
+    zip_object.fp.write(zip_info.FileHeader(zip64))
+    zip_object.fp.write(payload)
+
+    zip_object.start_dir = zip_object.fp.tell()
+    zip_object.filelist.append(zip_info)
+    zip_object.NameToInfo[zip_info.filename] = zip_info
@@ -1,5 +1,12 @@
 import os
+import queue
+import shutil
+import tempfile
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
 from io import BytesIO
 from typing import Union
 from typing import Callable, Optional
@@ -19,6 +26,20 @@ SUPPORTED_ARCHIVE_MIMES: list = [
 ]
 
 
+# Number of batches of zip members for each worker in the parallel search. A few batches per worker keep all the
+# workers busy until the end and let the search stop early, each worker opens the archive only once.
+PARALLEL_BATCHES_PER_WORKER: int = 4
+# Uncompressed size limit of a batch, so the members that a worker returns to the main process stay bounded.
+PARALLEL_BATCH_MAX_SIZE: int = 32 * 1024 * 1024
+# Uncompressed size of the 7z members that are kept in memory by a single extraction pass over the archive, the rest
+# are written to temporary files until they are needed.
+SEVENZ_MEMORY_MAX_SIZE: int = 64 * 1024 * 1024
+# Number of zip members and their total uncompressed size that the reading thread decompresses ahead of the
+# callbacks. A member bigger than the size limit is read ahead only when nothing else is waiting.
+PREFETCH_QUEUE_SIZE: int = 8
+PREFETCH_QUEUE_MAX_SIZE: int = 32 * 1024 * 1024
+
+
 # Custom exception if the file is not known archive type.
 class UnknownArchiveType(Exception):
     pass
@@ -32,178 +53,623 @@ except ImportError:
 
 
 class _MemIO(Py7zIO):
-    def __init__(self):
-        self._buf = BytesIO()
-    def write(self, b: bytes):
-        self._buf.write(b)
+    def __init__(self, size_hint: int = 0):
+        # Preallocate to the expected size, so the buffer doesn't grow with each write.
+        self._buf = bytearray(size_hint)
+        self._pos = 0
+    def write(self, b: bytes) -> int:
+        self._buf[self._pos:self._pos + len(b)] = b
+        self._pos += len(b)
+        return len(b)
     # read/seek/flush/size are used by the API examples and keep this compatible
     def read(self, size: Optional[int] = None) -> bytes:
-        data = self._buf.getvalue()
-        return data if size is None else data[:size]
+        with memoryview(self._buf) as view:
+            return bytes(view[:self._pos] if size is None else view[:min(size, self._pos)])
     def seek(self, offset: int, whence: int = 0) -> int:
-        return self._buf.seek(offset, whence)
+        # Writes always append, so the current position is always the end of the written data.
+        return offset if whence == 0 else self._pos + offset
     def flush(self) -> None:
         pass
     def size(self) -> int:
-        return len(self._buf.getvalue())
+        return self._pos
+    def drain(self) -> bytes:
+        """Return the collected bytes and release the buffer."""
+        data = self.read()
+        self.close()
+        return data
+    def close(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0
+
+
+class _TempFileIO(Py7zIO):
+    """Same as '_MemIO', but the bytes are written to a temporary file."""
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._size = 0
+    def write(self, b: bytes) -> int:
+        self._file.write(b)
+        self._size += len(b)
+        return len(b)
+    def read(self, size: Optional[int] = None) -> bytes:
+        self._file.seek(0)
+        return self._file.read(-1 if size is None else size)
+    def seek(self, offset: int, whence: int = 0) -> int:
+        # Writes always append, so the current position is always the end of the written data.
+        return offset if whence == 0 else self._size + offset
+    def flush(self) -> None:
+        self._file.flush()
+    def size(self) -> int:
+        return self._size
+    def drain(self) -> bytes:
+        """Return the collected bytes and remove the file."""
+        data = self.read()
+        self.close()
+        return data
+    def close(self) -> None:
+        self._file.close()
 
 
 class _MemFactory(WriterFactory):
-    def __init__(self):
-        self.products = {}  # filename -> _MemIO
+    def __init__(self, sizes: dict[str, int] = None, memory_max_size: int = None):
+        self.products = {}  # filename -> _MemIO or _TempFileIO
+        self._sizes = sizes or {}  # filename -> expected uncompressed size
+        # Files that don't fit in 'memory_max_size' bytes with the previous ones are written to temporary files.
+        self._memory_max_size = memory_max_size
+        self._memory_size = 0
     def create(self, filename: str) -> Py7zIO:
-        obj = _MemIO()
+        size = self._sizes.get(filename, 0)
+        if self._memory_max_size is not None and size and self._memory_size + size > self._memory_max_size:
+            obj = _TempFileIO()
+        else:
+            obj = _MemIO(size)
+            self._memory_size += size
         self.products[filename] = obj
         return obj
 
 
-def _read_7z_member_bytes(arch_obj, name: str) -> bytes:
+def _read_7z_member_bytes(arch_obj, name: str, size: int = None) -> bytes:
+    return _read_7z_members_bytes(arch_obj, [name], {name: size} if size else None)[name]
+
+
+def _read_7z_members_bytes(arch_obj, names: list[str], sizes: dict[str, int] = None) -> dict[str, bytes]:
+    """
+    Read all the given members in a single pass over the archive, see '_extract_7z_members'.
+    :return: dictionary, member name -> bytes.
+    """
+    return {name: product.drain() for name, product in _extract_7z_members(arch_obj, names, sizes).items()}
+
+
+def _extract_7z_members(arch_obj, names: list[str], sizes: dict[str, int] = None, memory_max_size: int = None) -> dict:
+    """
+    Extract all the given members in a single pass over the archive. In solid archives each separate read decodes the
+    solid block from its start again, so reading the members one by one is quadratic.
+    :param sizes: dictionary, member name -> uncompressed size from 'list()', to preallocate the buffers.
+    :param memory_max_size: integer, default is None. If set, the members that don't fit in this number of bytes with
+        the previous ones are written to temporary files. Needs 'sizes'.
+    :return: dictionary, member name -> '_MemIO' or '_TempFileIO', the content is taken by 'drain()'.
+    """
+    if not names:
+        return {}
+
     # Backward compatibility (py7zr < 1.0.0)
     if hasattr(arch_obj, "read"):
-        data = arch_obj.read([name])
+        data = arch_obj.read(names)
         try:
-            return data[name].read()
+            products = {}
+            for name, file_data in data.items():
+                products[name] = _MemIO()
+                products[name].write(file_data.read())
+            return products
         finally:
             arch_obj.reset()
     # py7zr >= 1.0.0: use extract(..., factory=...)
-    factory = _MemFactory()
-    targets = [name]
+    factory = _MemFactory(sizes, memory_max_size)
+    targets = set(names)
     # py7zr quirk: when targeting 'dir/file', include parent dir too
-    if "/" in name:
-        top = name.split("/", 1)[0]
-        if top and top != name:
-            targets = [top, name]  # see API docs note below
-    arch_obj.extract(targets=targets, factory=factory)
+    for name in names:
+        if "/" in name:
+            top = name.split("/", 1)[0]
+            if top:
+                targets.add(top)
     try:
-        return factory.products[name].read()
+        arch_obj.extract(targets=list(targets), factory=factory)
+    except BaseException:
+        for product in factory.products.values():
+            product.close()
+        raise
     finally:
         arch_obj.reset()
+    return factory.products
 
 
-def _get_unique_filename(directory, filename):
+class _ArchiveMember:
+    """
+    Content of a single file inside the archive. The file is decompressed only when its bytes are first needed.
+    """
+    def __init__(self, arch_obj, archive_type: str, item, archived_file_bytes: bytes = None):
+        self.arch_obj = arch_obj
+        self.archive_type: str = archive_type
+        self.item = item
+        self._bytes: Optional[bytes] = archived_file_bytes
+
+    def get_bytes(self) -> bytes:
+        if self._bytes is None:
+            if self.archive_type == 'zip':
+                with self.arch_obj.open(self.item) as file_data:
+                    self._bytes = file_data.read()
+            elif self.archive_type == '7z':
+                self._bytes = _read_7z_member_bytes(self.arch_obj, self.item.filename, self.item.uncompressed)
+        return self._bytes
+
+    def is_read(self) -> bool:
+        return self._bytes is not None
+
+    def open(self):
+        """
+        Binary file object of the content. If the bytes of a zip member weren't read yet, it is read straight from
+        the archive, so the file is decompressed only as far as the reader gets.
+        """
+        if self._bytes is None and self.archive_type == 'zip':
+            return self.arch_obj.open(self.item)
+        return BytesIO(self.get_bytes())
+
+
+def _is_streaming(callback: Callable) -> bool:
+    return getattr(callback, 'streaming', False)
+
+
+def _run_callback(callback: Callable, member: _ArchiveMember):
+    if _is_streaming(callback):
+        with member.open() as file_data:
+            return callback(file_data)
+    return callback(member.get_bytes())
+
+
+def _get_unique_filename(directory, filename, extracted_names):
     """
     Generates a unique filename by appending a number if the file already exists.
+    'extracted_names' keeps the next number for each file name that was already extracted to the directory, so the
+    counting continues from it instead of checking all the previous names on the disk again.
     """
     name, ext = os.path.splitext(filename)
-    counter = 1
-    unique_filename = filename
+    counter = extracted_names.get(filename, 0)
+    unique_filename = f"{name}_{counter}{ext}" if counter else filename
     while os.path.exists(os.path.join(directory, unique_filename)):
-        unique_filename = f"{name}_{counter}{ext}"
         counter += 1
+        unique_filename = f"{name}_{counter}{ext}"
+    extracted_names[filename] = counter + 1
     return unique_filename
 
 
-def _match_file_name(target, current, case_sensitive):
+def _match_file_name(current, name_targets, case_sensitive):
+    # 'str.endswith' checks all the targets in one call. For case insensitive search the targets are already
+    # lowercased in 'search_file_in_archive'.
     if case_sensitive:
-        return current.endswith(target)
+        return current.endswith(name_targets)
     else:
-        return current.lower().endswith(target.lower())
+        return current.lower().endswith(name_targets)
 
 
-def _handle_file_extraction(item, extract_file_to_path, archived_file_bytes):
+def _handle_file_extraction(item, extract_file_to_path, extracted_names, member):
     if extract_file_to_path:
-        unique_filename = _get_unique_filename(extract_file_to_path, os.path.basename(item.filename))
+        unique_filename = _get_unique_filename(
+            extract_file_to_path, os.path.basename(item.filename), extracted_names)
         with open(os.path.join(extract_file_to_path, unique_filename), 'wb') as f:
-            f.write(archived_file_bytes)
+            if member.is_read():
+                f.write(member.get_bytes())
+            else:
+                # Nothing needed the bytes, stream the file straight from the archive to the disk.
+                with member.open() as file_data:
+                    shutil.copyfileobj(file_data, f, zips.COPY_BUFFER_SIZE)
 
 
 def _handle_callback_matching(
-        item, archive_type, archived_file_bytes, callback_functions, results, found_set, return_first_only):
-    for callback in callback_functions:
-        callback_result = callback(archived_file_bytes)
+        item, archive_type, member, callback_specs, results, found_set, return_first_only, return_bytes):
+    for callback_name, callback in callback_specs:
+        callback_result = _run_callback(callback, member)
         if callback_result:
-            # Initialize key for callback function name if not present
-            if _get_callback_name(callback) not in results:
-                results[_get_callback_name(callback)]: dict = {}
-                results[_get_callback_name(callback)]['files']: list = []
-
-            if archive_type == 'zip':
-                file_info = {
-                    'bytes': archived_file_bytes,
-                    'name': item.filename,
-                    'size': item.file_size,
-                    'modified_time': item.date_time
-                }
-            elif archive_type == '7z':
-                file_info = {
-                    'bytes': archived_file_bytes,
-                    'name': item.filename,
-                    'size': item.uncompressed,
-                    'modified_time': item.creationtime
-                }
-            else:
-                raise UnknownArchiveType(f"Unknown archive type: {archive_type}")
-
-            results[_get_callback_name(callback)]['files'].append(file_info)
-            results[_get_callback_name(callback)]['callable_result'] = callback_result
-            if return_first_only:
-                found_set.add(item.filename)
+            _add_callback_result(
+                item, archive_type, member, callback_name, callback_result, results, found_set, return_first_only,
+                return_bytes)
             return True
     return False
 
 
-def _handle_name_matching(item, archived_file_bytes, file_names, case_sensitive, results, found_set, return_first_only):
-    if any(_match_file_name(file_name, item.filename, case_sensitive) for file_name in file_names):
-        if item.filename not in results:
-            results[item.filename] = []
+def _add_callback_result(
+        item, archive_type, member, callback_name, callback_result, results, found_set, return_first_only,
+        return_bytes):
+    # Initialize key for callback function name if not present
+    callback_results = results.setdefault(callback_name, {'files': []})
+
+    callback_results['files'].append(_get_file_info(item, archive_type, member, return_bytes))
+    callback_results['callable_result'] = callback_result
+    if return_first_only:
+        found_set.add(item.filename)
+
+
+def _get_file_info(item, archive_type, member, return_bytes) -> dict:
+    # Without 'return_bytes' only the metadata from the archive index is used, the file isn't decompressed.
+    archived_file_bytes = member.get_bytes() if return_bytes else None
+
+    if archive_type == 'zip':
         file_info = {
             'bytes': archived_file_bytes,
             'name': item.filename,
             'size': item.file_size,
             'modified_time': item.date_time
         }
-        results[item.filename].append(file_info)
+    elif archive_type == '7z':
+        file_info = {
+            'bytes': archived_file_bytes,
+            'name': item.filename,
+            'size': item.uncompressed,
+            'modified_time': item.creationtime
+        }
+    else:
+        raise UnknownArchiveType(f"Unknown archive type: {archive_type}")
+
+    return file_info
+
+
+def _handle_name_matching(
+        item, archive_type, member, name_targets, case_sensitive, results, found_set, return_first_only,
+        return_bytes):
+    if _match_file_name(item.filename, name_targets, case_sensitive):
+        if item.filename not in results:
+            results[item.filename] = []
+        results[item.filename].append(_get_file_info(item, archive_type, member, return_bytes))
         if return_first_only:
             found_set.add(item.filename)
 
 
 def _search_in_archive(
-        arch_obj, archive_type, file_names, results, found_set, case_sensitive, return_first_only, recursive,
-        callback_functions, extract_file_to_path):
+        arch_obj, archive_type, name_targets, results, found_set, case_sensitive, return_first_only, recursive,
+        callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers):
     file_info_list = None
     if archive_type == 'zip':
         file_info_list = arch_obj.infolist()
     elif archive_type == '7z':
         file_info_list = arch_obj.list()
 
+    # The 7z members that will be needed are extracted ahead in one pass, see '_iter_members'. When only the first
+    # callback match is needed, the members are still extracted one by one, so the search can stop before decoding the
+    # rest of the archive.
+    members_sizes: dict[str, int] = {}
+    if archive_type == '7z' and not (return_first_only and callback_specs):
+        members_sizes = {
+            item.filename: item.uncompressed for item in file_info_list
+            if not item.is_directory and (
+                callback_specs or recursive or
+                (return_bytes and name_targets and _match_file_name(item.filename, name_targets, case_sensitive)))
+        }
+
+    # The bytes of the archived file, which is an 'item' in the archive, are read only when something needs them:
+    # a callback that isn't streaming, a match, or a check for a nested archive.
+    # If all the zip members are going to be read anyway, they are read ahead by a separate thread.
+    if archive_type == 'zip' and _needs_all_bytes(recursive, callback_specs):
+        members = _iter_prefetched_zip_members(arch_obj, file_info_list)
+    else:
+        members = _iter_members(arch_obj, archive_type, file_info_list, members_sizes)
+
     # Iterate over each file in the archive.
-    for item_index, item in enumerate(file_info_list):
-        # At this stage we will get the bytes of the archived file, which is an 'item' in the archive.
-        archived_file_bytes = None
-        # If the main archive is zip we will use the 'open' method, if it's 7z we will use the 'read' method.
-        if archive_type == 'zip':
-            # Skip directories.
-            if item.filename.endswith('/'):
-                continue
+    with closing(members):
+        for member in members:
+            # Check before touching the next file, the last match could have been found in a nested archive.
+            if name_targets is not None and len(found_set) == len(name_targets):
+                break  # All files found, stop searching
+
+            item = member.item
+
+            # Check if the file matches the callback functions.
+            callback_matched = False
+            if callback_specs:
+                callback_matched = _handle_callback_matching(
+                    item, archive_type, member, callback_specs, results, found_set, return_first_only, return_bytes)
+
+            if callback_matched:
+                _handle_file_extraction(item, extract_file_to_path, extracted_names, member)
+            else:
+                if recursive and _is_archive(member.get_bytes()):
+                    _search_archive_content(
+                        member.get_bytes(), name_targets, results, found_set, case_sensitive, return_first_only,
+                        recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers,
+                        _get_archive_type_by_signature(member.get_bytes()))
+                # With 'return_first_only', a file that was already found isn't matched again.
+                if name_targets and item.filename not in found_set:
+                    _handle_name_matching(
+                        item, archive_type, member, name_targets, case_sensitive, results, found_set,
+                        return_first_only, return_bytes)
 
-            with arch_obj.open(item) as file_data:
-                archived_file_bytes = file_data.read()
-        elif archive_type == '7z':
+
+def _needs_all_bytes(recursive, callback_specs) -> bool:
+    return recursive or any(not _is_streaming(callback) for _, callback in callback_specs or [])
+
+
+def _is_directory(item, archive_type) -> bool:
+    if archive_type == 'zip':
+        return item.filename.endswith('/')
+    elif archive_type == '7z':
+        return item.is_directory
+
+
+def _iter_members(arch_obj, archive_type, file_info_list, members_sizes):
+    """
+    Yield the members of the archive, directories are skipped.
+    The 7z members in 'members_sizes' are extracted ahead in a single pass over the archive. Only
+    SEVENZ_MEMORY_MAX_SIZE bytes of them are kept in memory, the rest wait in temporary files until they are reached.
+    :param members_sizes: dictionary, 7z member name -> uncompressed size.
+    """
+
+    members_data: dict = {}
+    if members_sizes:
+        members_data = _extract_7z_members(arch_obj, list(members_sizes), members_sizes, SEVENZ_MEMORY_MAX_SIZE)
+
+    try:
+        for item in file_info_list:
             # Skip directories.
-            if item.is_directory:
+            if _is_directory(item, archive_type):
                 continue
 
-            archived_file_bytes = _read_7z_member_bytes(arch_obj, item.filename)
+            member_data = members_data.pop(item.filename, None)
+            archived_file_bytes = member_data.drain() if member_data is not None else None
+            yield _ArchiveMember(arch_obj, archive_type, item, archived_file_bytes)
+    finally:
+        # The search stopped before these members, drop their buffers and temporary files.
+        for member_data in members_data.values():
+            member_data.close()
+
+
+def _iter_prefetched_zip_members(arch_obj, file_info_list):
+    """
+    Yield the zip members with their bytes already read by a producer thread, so decompressing the next members
+    overlaps with the callbacks on the current one. 'zlib' releases the GIL while inflating.
+    Up to PREFETCH_QUEUE_SIZE members with PREFETCH_QUEUE_MAX_SIZE bytes in total are read ahead.
+    Closing the generator stops the producer.
+    """
+
+    members_queue: queue.Queue = queue.Queue(maxsize=PREFETCH_QUEUE_SIZE)
+    stop_event = threading.Event()
+    end_of_members = object()
+    # Uncompressed size of the members that were read ahead and weren't taken by the consumer yet.
+    queued_size_condition = threading.Condition()
+    queued_size: int = 0
 
-        # After we get the file bytes we will check if the file matches the callback functions.
-        callback_matched = False
-        if callback_functions:
-            callback_matched = _handle_callback_matching(
-                item, archive_type, archived_file_bytes, callback_functions, results, found_set, return_first_only)
+    def is_queue_ready(item) -> bool:
+        return stop_event.is_set() or not queued_size or queued_size + item.file_size <= PREFETCH_QUEUE_MAX_SIZE
 
-        if callback_matched:
-            _handle_file_extraction(item, extract_file_to_path, archived_file_bytes)
+    def produce():
+        nonlocal queued_size
+        try:
+            for item in file_info_list:
+                if _is_directory(item, 'zip'):
+                    continue
+
+                with queued_size_condition:
+                    queued_size_condition.wait_for(lambda: is_queue_ready(item))
+                    if stop_event.is_set():
+                        break
+                    queued_size += item.file_size
+
+                member = _ArchiveMember(arch_obj, 'zip', item)
+                member.get_bytes()
+                members_queue.put(member)
+        except BaseException as e:
+            # Raised again in the consumer.
+            members_queue.put(e)
+        finally:
+            members_queue.put(end_of_members)
+
+    def release(member) -> None:
+        nonlocal queued_size
+        with queued_size_condition:
+            queued_size -= member.item.file_size
+            queued_size_condition.notify()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while (member := members_queue.get()) is not end_of_members:
+            if isinstance(member, BaseException):
+                raise member
+            release(member)
+            yield member
+    finally:
+        # Unblock the producer if it waits for the queue and wait for it to finish with the archive.
+        stop_event.set()
+        with queued_size_condition:
+            queued_size_condition.notify()
+        while member is not end_of_members:
+            member = members_queue.get()
+        producer.join()
+
+
+def _is_archive(archived_file_bytes: bytes) -> bool:
+    return zips.is_zip_zipfile(archived_file_bytes) or sevenzs.is_7z_magic_number(archived_file_bytes)
+
+
+def _get_archive_type_by_signature(archived_file_bytes: bytes) -> Union[str, None]:
+    """
+    Get the type of nested archive from the signature at the start of the bytes, so the recursive search doesn't need
+    to check the MIME type and the structure of the archive again.
+    :return: string, 'zip' or '7z'. None, if the archive has data before it (SFX), then the type is checked by
+        '_get_archive_type'.
+    """
+    if archived_file_bytes[:4] in zips.ZIP_MAGIC_NUMBERS:
+        return 'zip'
+    elif archived_file_bytes[:6] == sevenzs.SEVENZ_MAGIC_NUMBER:
+        return '7z'
+    else:
+        return None
+
+
+def _split_to_batches(file_info_list: list, batch_count: int) -> list[list[int]]:
+    """
+    Split the zip members to at least 'batch_count' batches of indexes in 'file_info_list', with a similar compressed
+    size in each batch. Batches are also closed at PARALLEL_BATCH_MAX_SIZE uncompressed bytes. Directories are skipped.
+    """
+    item_indexes: list[int] = [
+        item_index for item_index, item in enumerate(file_info_list) if not item.filename.endswith('/')]
+    batch_size_limit: float = sum(file_info_list[item_index].compress_size for item_index in item_indexes) / batch_count
+
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    batch_size: int = 0
+    batch_uncompressed_size: int = 0
+    for item_index in item_indexes:
+        batch.append(item_index)
+        batch_size += file_info_list[item_index].compress_size
+        batch_uncompressed_size += file_info_list[item_index].file_size
+        if batch_size >= batch_size_limit or batch_uncompressed_size >= PARALLEL_BATCH_MAX_SIZE:
+            batches.append(batch)
+            batch, batch_size, batch_uncompressed_size = [], 0, 0
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# Archive and search parameters of a worker process in the parallel zip search, set by '_init_zip_worker'.
+_worker_zip_search: Optional[tuple] = None
+
+
+def _init_zip_worker(file_path, name_targets, case_sensitive, recursive, callback_specs, return_bytes):
+    """
+    Initializer of the worker processes of the parallel zip search. The archive is opened and its central directory
+    is parsed once per process, and stays open until the process exits.
+    """
+    global _worker_zip_search
+    arch_obj = zipfile.ZipFile(file_path, 'r')
+    _worker_zip_search = (
+        arch_obj, arch_obj.infolist(), file_path, name_targets, case_sensitive, recursive, callback_specs,
+        return_bytes)
+
+
+def _scan_zip_members_in_worker(item_indexes):
+    arch_obj, file_info_list, file_path, *search_parameters = _worker_zip_search
+    return _scan_zip_members(arch_obj, file_info_list, file_path, item_indexes, *search_parameters)
+
+
+def _scan_zip_members(
+        arch_obj, file_info_list, file_path, item_indexes, name_targets, case_sensitive, recursive, callback_specs,
+        return_bytes):
+    """
+    Worker of the parallel zip search. Decompresses the members and runs the callback functions on them.
+    :param file_path: string, full path to the zip file, the members are read from it with positional reads.
+        None, if the zip file is in memory, then the members are read from 'arch_obj'.
+    :return: list of tuples: (item_index, callback_name, callback_result, is_nested_archive, archived_file_bytes).
+        'archived_file_bytes' is returned only if the main process needs it: a callback or a file name matched and
+        the bytes are returned, or the member is a nested archive that will be searched recursively. Otherwise, it
+        is None.
+    """
+    scanned_members: list = []
+    items = [file_info_list[item_index] for item_index in item_indexes]
+
+    if file_path and _needs_all_bytes(recursive, callback_specs):
+        # Read the batch with positional reads, the next members are inflated by a single thread while the callbacks
+        # run on the current one. The parallelism is in the worker processes.
+        items_bytes = zips.iter_members_with_pread(file_path, items, max_workers=1)
+    else:
+        items_bytes = (None for _ in items)
+
+    with closing(items_bytes):
+        for item_index, item, archived_file_bytes in zip(item_indexes, items, items_bytes):
+            member = _ArchiveMember(arch_obj, 'zip', item, archived_file_bytes)
+
+            callback_name, callback_result = None, None
+            for name, callback in callback_specs or []:
+                result = _run_callback(callback, member)
+                if result:
+                    callback_name, callback_result = name, result
+                    break
+
+            is_nested_archive = not callback_name and recursive and _is_archive(member.get_bytes())
+            name_matched = bool(name_targets) and _match_file_name(item.filename, name_targets, case_sensitive)
+
+            archived_file_bytes = None
+            if is_nested_archive or (return_bytes and (callback_name or name_matched)):
+                archived_file_bytes = member.get_bytes()
+
+            scanned_members.append((item_index, callback_name, callback_result, is_nested_archive, archived_file_bytes))
+    return scanned_members
+
+
+def _search_in_zip_parallel(
+        file_object, arch_obj, name_targets, results, found_set, case_sensitive, return_first_only, recursive,
+        callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers):
+    file_info_list = arch_obj.infolist()
+    batches = _split_to_batches(file_info_list, max_workers * PARALLEL_BATCHES_PER_WORKER)
+
+    # A zip on the disk is opened once by each worker process, which gets only the indexes of the members.
+    # Bytes would have been pickled to the workers, so threads are used instead. They share the already parsed
+    # 'arch_obj', reading from it is thread safe, and 'zlib' releases the GIL while inflating.
+    if isinstance(file_object, str):
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_zip_worker,
+            initargs=(file_object, name_targets, case_sensitive, recursive, callback_specs, return_bytes))
+        scan_batch = _scan_zip_members_in_worker
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def scan_batch(item_indexes):
+            return _scan_zip_members(
+                arch_obj, file_info_list, None, item_indexes, name_targets, case_sensitive, recursive,
+                callback_specs, return_bytes)
+
+    with executor:
+        # Only 'max_workers * 2' batches are in flight at a time, so the scanned members that wait for the main
+        # process stay bounded. Pending batches are dropped if the search stops early or fails.
+        pending: deque = deque()
+        try:
+            for batch in batches:
+                pending.append(executor.submit(scan_batch, batch))
+                while len(pending) > max_workers * 2:
+                    if _add_scanned_members(
+                            pending.popleft().result(), file_info_list, arch_obj, name_targets, results, found_set,
+                            case_sensitive, return_first_only, recursive, callback_specs, extract_file_to_path,
+                            extracted_names, return_bytes, max_workers):
+                        return
+            while pending:
+                if _add_scanned_members(
+                        pending.popleft().result(), file_info_list, arch_obj, name_targets, results, found_set,
+                        case_sensitive, return_first_only, recursive, callback_specs, extract_file_to_path,
+                        extracted_names, return_bytes, max_workers):
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _add_scanned_members(
+        scanned_members, file_info_list, arch_obj, name_targets, results, found_set, case_sensitive, return_first_only,
+        recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers) -> bool:
+    """
+    Add the members of a batch that was scanned by '_scan_zip_members' to the results, in the order of the archive.
+    :return: boolean, True if all the files were found and the search should stop.
+    """
+    for item_index, callback_name, callback_result, is_nested_archive, archived_file_bytes in scanned_members:
+        item = file_info_list[item_index]
+        member = _ArchiveMember(arch_obj, 'zip', item, archived_file_bytes)
+        if callback_name:
+            _add_callback_result(
+                item, 'zip', member, callback_name, callback_result, results, found_set, return_first_only,
+                return_bytes)
+            _handle_file_extraction(item, extract_file_to_path, extracted_names, member)
         else:
-            if recursive and (zips.is_zip_zipfile(archived_file_bytes) or sevenzs.is_7z_magic_number(archived_file_bytes)):
+            if is_nested_archive:
                 _search_archive_content(
-                    archived_file_bytes, file_names, results, found_set, case_sensitive, return_first_only,
-                    recursive, callback_functions, extract_file_to_path)
-            if file_names and not callback_matched:
+                    archived_file_bytes, name_targets, results, found_set, case_sensitive, return_first_only,
+                    recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers,
+                    _get_archive_type_by_signature(archived_file_bytes))
+            if name_targets and item.filename not in found_set:
                 _handle_name_matching(
-                    item, archived_file_bytes, file_names, case_sensitive, results, found_set, return_first_only)
+                    item, 'zip', member, name_targets, case_sensitive, results, found_set,
+                    return_first_only, return_bytes)
 
-        if file_names is not None and len(found_set) == len(file_names):
-            break  # All files found, stop searching
+        if name_targets is not None and len(found_set) == len(name_targets):
+            # All files found.
+            return True
+    return False
 
 
 def _get_callback_name(callback: Callable) -> str:
@@ -233,7 +699,14 @@ def _get_archive_type(file_object) -> Union[str, None]:
     if file_mime not in SUPPORTED_ARCHIVE_MIMES:
         return None
 
-    if zips.is_zip_zipfile(file_object):
+    # Check the signature at the start first, SFX archives and zip files with data before them are checked by the
+    # end of central directory record.
+    if isinstance(file_object, bytes):
+        is_zip_signature = file_object[:4] in zips.ZIP_MAGIC_NUMBERS
+    else:
+        is_zip_signature = zips.is_zip_magic_number(file_object)
+
+    if is_zip_signature or zips.is_zip_zipfile(file_object):
         return 'zip'
     elif sevenzs.is_7z_magic_number(file_object):
         return '7z'
@@ -241,35 +714,70 @@ def _get_archive_type(file_object) -> Union[str, None]:
         raise UnknownArchiveType(f"{file_object[:10]} is not a known archive type.")
 
 
+def _open_zip(file_object, zip_file) -> zipfile.ZipFile:
+    """
+    Open the zip file for the search. Zip files that are recognized only by the signature at the start can still be
+    truncated or corrupted, they are reported the same as by the end of central directory check in '_get_archive_type'.
+    :param file_object: string or bytes, the searched archive, for the exception message.
+    :param zip_file: string or file-like object, opened by 'zipfile.ZipFile'.
+    """
+    try:
+        return zipfile.ZipFile(zip_file, 'r')
+    except zipfile.BadZipFile as e:
+        raise UnknownArchiveType(f"{file_object[:10]} is not a known archive type.") from e
+
+
 def _search_archive_content(
-        file_object, file_names_to_search, results, found_set, case_sensitive, return_first_only, recursive,
-        callback_functions, extract_file_to_path):
-    archive_type = _get_archive_type(file_object)
+        file_object, name_targets, results, found_set, case_sensitive, return_first_only, recursive,
+        callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers,
+        archive_type=None):
+    # The type is already known for nested archives.
+    if archive_type is None:
+        archive_type = _get_archive_type(file_object)
 
     if isinstance(file_object, str):
         if archive_type == 'zip':
-            with zipfile.ZipFile(file_object, 'r') as archive_ref:
-                _search_in_archive(
-                    archive_ref, archive_type, file_names_to_search, results, found_set, case_sensitive,
-                    return_first_only, recursive, callback_functions, extract_file_to_path)
+            with _open_zip(file_object, file_object) as archive_ref:
+                _search_in_zip(
+                    file_object, archive_ref, name_targets, results, found_set, case_sensitive,
+                    return_first_only, recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes,
+                    max_workers)
         elif archive_type == '7z':
             with py7zr.SevenZipFile(file_object, 'r') as archive_ref:
                 _search_in_archive(
-                    archive_ref, archive_type, file_names_to_search, results, found_set, case_sensitive,
-                    return_first_only, recursive, callback_functions, extract_file_to_path)
+                    archive_ref, archive_type, name_targets, results, found_set, case_sensitive,
+                    return_first_only, recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes,
+                    max_workers)
     elif isinstance(file_object, bytes):
         if archive_type == 'zip':
             with BytesIO(file_object) as file_like_object:
-                with zipfile.ZipFile(file_like_object, 'r') as archive_ref:
-                    _search_in_archive(
-                        archive_ref, archive_type, file_names_to_search, results, found_set, case_sensitive,
-                        return_first_only, recursive, callback_functions, extract_file_to_path)
+                with _open_zip(file_object, file_like_object) as archive_ref:
+                    _search_in_zip(
+                        file_object, archive_ref, name_targets, results, found_set, case_sensitive,
+                        return_first_only, recursive, callback_specs, extract_file_to_path, extracted_names,
+                        return_bytes, max_workers)
         elif archive_type == '7z':
             with BytesIO(file_object) as file_like_object:
                 with py7zr.SevenZipFile(file_like_object, 'r') as archive_ref:
                     _search_in_archive(
-                        archive_ref, archive_type, file_names_to_search, results, found_set, case_sensitive,
-                        return_first_only, recursive, callback_functions, extract_file_to_path)
+                        archive_ref, archive_type, name_targets, results, found_set, case_sensitive,
+                        return_first_only, recursive, callback_specs, extract_file_to_path, extracted_names,
+                        return_bytes, max_workers)
+
+
+def _search_in_zip(
+        file_object, archive_ref, name_targets, results, found_set, case_sensitive, return_first_only,
+        recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers):
+    # When the members don't need to be decompressed, the search is only a scan of the archive index, it is done in
+    # the main process.
+    if max_workers and max_workers > 1 and (return_bytes or _needs_all_bytes(recursive, callback_specs)):
+        _search_in_zip_parallel(
+            file_object, archive_ref, name_targets, results, found_set, case_sensitive, return_first_only,
+            recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers)
+    else:
+        _search_in_archive(
+            archive_ref, 'zip', name_targets, results, found_set, case_sensitive, return_first_only,
+            recursive, callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers)
 
 
 def search_file_in_archive(
@@ -280,7 +788,9 @@ def search_file_in_archive(
         return_empty_list_per_file_name: bool = False,
         recursive: bool = False,
         callback_functions: list = None,
-        extract_file_to_path: str = None
+        extract_file_to_path: str = None,
+        return_bytes: bool = True,
+        max_workers: int = None
 ) -> dict[list[bytes], str]:
     """
     Function searches for the file names inside the zip file and returns a dictionary where the keys are the
@@ -297,7 +807,23 @@ def search_file_in_archive(
     :param recursive: boolean, default is 'False'. If True, search for file names recursively in nested zip files.
     :param callback_functions: list of callables, default is None. Each function takes a file name and should return a
         boolean that will tell the main function if this file is 'found' or not.
+        If the callable has the attribute 'streaming' set to True, it gets a binary file object of the archived file
+        instead of its bytes, and the file is decompressed only as far as the callable reads it. Use it for checks
+        that need only the beginning of the file, like magic numbers or headers.
     :param extract_file_to_path: string, full path to the directory where the found files should be extracted.
+    :param return_bytes: boolean, default is 'True'.
+        'True': The 'bytes' of each found file are returned.
+        'False': 'bytes' of each found file is None. Files that are matched only by name are taken from the archive
+            index and are never decompressed, so searching by names is a scan of the archive index only.
+            Files that are extracted to 'extract_file_to_path' are streamed to the disk.
+    :param max_workers: integer, default is None. If bigger than 1, the members of zip archives are decompressed and
+        checked by the callback functions in parallel. Zip files on the disk are processed by worker processes, so
+        the callback functions must be picklable (module level functions or methods of picklable objects). Where the
+        worker processes are started with 'spawn' or 'forkserver', the default on Windows and macOS and on Linux
+        since Python 3.14, the calling script must be guarded by "if __name__ == '__main__':". Zip files passed as
+        bytes are processed by worker threads. 7z archives are always searched serially, since the solid stream can't be
+        split between workers. Searches that only need the archive index, with 'return_bytes=False' and without
+        callback functions that need the bytes, are done serially as well.
     :return: dictionary of lists of bytes.
     """
 
@@ -308,9 +834,25 @@ def search_file_in_archive(
     results: dict[list[bytes], str] = {}
     found_set = set()
 
+    # Prepare the file names once for the matching of each archived file.
+    name_targets = None
+    if file_names_to_search is not None:
+        if case_sensitive:
+            name_targets = tuple(file_names_to_search)
+        else:
+            name_targets = tuple(file_name.lower() for file_name in file_names_to_search)
+
+    # Get the callback names once, they are the keys of the results.
+    callback_specs = None
+    if callback_functions is not None:
+        callback_specs = [(_get_callback_name(callback), callback) for callback in callback_functions]
+
+    # Next number for each file name that was extracted, for the unique names of the extracted files.
+    extracted_names: dict[str, int] = {}
+
     _search_archive_content(
-        file_object, file_names_to_search, results, found_set, case_sensitive, return_first_only, recursive,
-        callback_functions, extract_file_to_path)
+        file_object, name_targets, results, found_set, case_sensitive, return_first_only, recursive,
+        callback_specs, extract_file_to_path, extracted_names, return_bytes, max_workers)
 
     if not return_empty_list_per_file_name:
         # Filter out keys with empty lists.